@@ -5,11 +5,21 @@ This module provides a simplified credibility analysis for MVP.
 It uses heuristic-based analysis that can be enhanced with actual ML models later.
 Supports GPU acceleration when CUDA is available.
 """
+import hashlib
+import itertools
 import os
 import re
-import uuid
+import threading
+from collections import Counter, OrderedDict
 from typing import Optional, Dict, Any
 
+# PyTorch is optional; resolve it once so GPU detection never re-imports it
+try:
+    import torch as _TORCH
+except Exception:
+    # PyTorch not installed or fails to load
+    _TORCH = None
+
 
 def detect_gpu() -> Dict[str, Any]:
     """
@@ -22,13 +32,21 @@ def detect_gpu() -> Dict[str, Any]:
         - device_name: Name of the GPU device (if available)
         - cuda_version: CUDA version (if available)
     """
+    if _TORCH is None:
+        # PyTorch not installed
+        return {
+            "available": False,
+            "device": "cpu",
+            "device_name": None,
+            "cuda_version": None
+        }
+    
     try:
-        import torch
-        cuda_available = torch.cuda.is_available()
+        cuda_available = _TORCH.cuda.is_available()
         
         if cuda_available:
-            device_name = torch.cuda.get_device_name(0)
-            cuda_version = torch.version.cuda
+            device_name = _TORCH.cuda.get_device_name(0)
+            cuda_version = _TORCH.version.cuda
             return {
                 "available": True,
                 "device": "cuda",
@@ -42,14 +60,6 @@ def detect_gpu() -> Dict[str, Any]:
                 "device_name": None,
                 "cuda_version": None
             }
-    except ImportError:
-        # PyTorch not installed
-        return {
-            "available": False,
-            "device": "cpu",
-            "device_name": None,
-            "cuda_version": None
-        }
     except Exception:
         # Any other error - fall back to CPU
         return {
@@ -60,6 +70,10 @@ def detect_gpu() -> Dict[str, Any]:
         }
 
 
+# Probe the GPU once at import; CUDA availability does not change at runtime
+_GPU_INFO = detect_gpu()
+
+
 def get_device() -> str:
     """
     Get the appropriate device for inference.
@@ -77,12 +91,11 @@ def get_device() -> str:
         return "cpu"
     
     # Check if GPU is actually available
-    gpu_info = detect_gpu()
-    return gpu_info["device"]
+    return _GPU_INFO["device"]
 
 
 # Cache the device selection at module load
-_DEVICE = None
+_DEVICE = get_device()
 
 
 def _get_cached_device() -> str:
@@ -93,64 +106,279 @@ def _get_cached_device() -> str:
     return _DEVICE
 
 
-# Credibility indicators - words/phrases that affect credibility score
+# Maps ASCII capitals to "A" and every other byte to ".". Non-ASCII characters
+# encode to UTF-8 bytes >= 0x80, so they break a run of capitals exactly as
+# any other character does.
+_CAPITALS_TABLE = bytes(0x41 if 0x41 <= byte <= 0x5A else 0x2E for byte in range(256))
+
+
+def _has_capital_run(text: str) -> bool:
+    """
+    Return True if the text has 5 or more consecutive ASCII capital letters.
+    
+    Equivalent to re.search(r"[A-Z]{5,}", text), but classifies every
+    character in one bytes.translate pass and then does a single substring
+    search, instead of the regex engine trying a match at every position.
+    """
+    return b"AAAAA" in text.encode("utf-8", "surrogatepass").translate(_CAPITALS_TABLE)
+
+
+# Credibility indicators - words/phrases that affect credibility score.
+# "phrases" are lowercase literals matched as whole words regardless of case;
+# "check" entries are predicates called with the original text;
+# "substring" entries are plain substring checks on the original text.
 POSITIVE_INDICATORS_PATTERNS = [
-    {"pattern": r"\b(study|studies|research)\b", "description": "References scientific research", "icon": "science"},
-    {"pattern": r"\b(according to|cited|source)\b", "description": "Cites sources", "icon": "verified"},
-    {"pattern": r"\b(expert|professor|doctor|dr\.)\b", "description": "References expert opinions", "icon": "expert"},
-    {"pattern": r"\b(peer[- ]reviewed|journal|published)\b", "description": "References peer-reviewed content", "icon": "academic"},
-    {"pattern": r"\b(data|statistics|percent|%)\b", "description": "Uses data and statistics", "icon": "chart"},
-    {"pattern": r"\b(university|institution|organization)\b", "description": "References institutions", "icon": "institution"},
+    {"phrases": ("study", "studies", "research"), "description": "References scientific research", "icon": "science"},
+    {"phrases": ("according to", "cited", "source"), "description": "Cites sources", "icon": "verified"},
+    {"phrases": ("expert", "professor", "doctor", "dr."), "description": "References expert opinions", "icon": "expert"},
+    {"phrases": ("peer-reviewed", "peer reviewed", "journal", "published"), "description": "References peer-reviewed content", "icon": "academic"},
+    {"phrases": ("data", "statistics", "percent", "%"), "description": "Uses data and statistics", "icon": "chart"},
+    {"phrases": ("university", "institution", "organization"), "description": "References institutions", "icon": "institution"},
 ]
 
 RED_FLAG_PATTERNS = [
-    {"pattern": r"\b(shocking|unbelievable|you won't believe)\b", "description": "Uses sensationalist language", "severity": "medium"},
-    {"pattern": r"\b(they don't want you to know|secret|hidden truth)\b", "description": "Conspiracy-style language", "severity": "high"},
-    {"pattern": r"\b(miracle|cure[- ]all|guaranteed)\b", "description": "Makes unrealistic claims", "severity": "high"},
-    {"pattern": r"\b(click here|share now|act fast)\b", "description": "Uses urgency tactics", "severity": "low"},
-    {"pattern": r"[A-Z]{5,}", "description": "Excessive use of capital letters", "severity": "low"},
-    {"pattern": r"!{2,}", "description": "Excessive exclamation marks", "severity": "low"},
-    {"pattern": r"\b(fake news|mainstream media lies)\b", "description": "Attacks credible sources", "severity": "medium"},
-    {"pattern": r"\b(100% proven|absolutely certain)\b", "description": "Uses absolute claims", "severity": "medium"},
+    {"phrases": ("shocking", "unbelievable", "you won't believe"), "description": "Uses sensationalist language", "severity": "medium"},
+    {"phrases": ("they don't want you to know", "secret", "hidden truth"), "description": "Conspiracy-style language", "severity": "high"},
+    {"phrases": ("miracle", "cure-all", "cure all", "guaranteed"), "description": "Makes unrealistic claims", "severity": "high"},
+    {"phrases": ("click here", "share now", "act fast"), "description": "Uses urgency tactics", "severity": "low"},
+    {"check": _has_capital_run, "description": "Excessive use of capital letters", "severity": "low"},
+    {"substring": "!!", "description": "Excessive exclamation marks", "severity": "low"},
+    {"phrases": ("fake news", "mainstream media lies"), "description": "Attacks credible sources", "severity": "medium"},
+    {"phrases": ("100% proven", "absolutely certain"), "description": "Uses absolute claims", "severity": "medium"},
 ]
 
-POSITIVE_KEYWORDS = [
+POSITIVE_KEYWORDS = (
     "research", "study", "evidence", "analysis", "data", "report",
     "expert", "scientist", "professor", "peer-reviewed", "journal",
     "verified", "confirmed", "documented", "official", "factual"
-]
+)
 
-NEGATIVE_KEYWORDS = [
+NEGATIVE_KEYWORDS = (
     "shocking", "unbelievable", "secret", "conspiracy", "hoax",
     "miracle", "guaranteed", "exclusive", "urgent", "breaking",
     "viral", "exposed", "banned", "censored", "suppressed"
-]
+)
+
+# Keyword -> impact, in the order matched keywords are reported
+_KEYWORD_IMPACTS = {
+    **dict.fromkeys(POSITIVE_KEYWORDS, "positive"),
+    **dict.fromkeys(NEGATIVE_KEYWORDS, "negative"),
+}
+_KEYWORD_RANKS = {keyword: rank for rank, keyword in enumerate(_KEYWORD_IMPACTS)}
+
+
+def _trie_alternation(phrases) -> str:
+    """
+    Build a regex alternation of literal phrases factored into a prefix trie.
+    
+    e.g. ["secret", "share", "shocking"] -> "s(?:ecret|h(?:are|ocking))".
+    The engine picks a branch with one character comparison per level
+    instead of trying every phrase at every position, which gives the single
+    linear pass of an Aho-Corasick automaton without a compiled dependency.
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-phrase marker
+    
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+    
+    return render(trie)
+
+
+# Red flags are pattern list 0 and positive indicators list 1, so a matched
+# pattern is a (list number, pattern index) pair
+_PATTERN_LISTS = (RED_FLAG_PATTERNS, POSITIVE_INDICATORS_PATTERNS)
+
+# Phrase -> (list number, pattern index)
+_TERM_OWNERS = {
+    phrase: (list_number, index)
+    for list_number, patterns in enumerate(_PATTERN_LISTS)
+    for index, pattern_info in enumerate(patterns)
+    for phrase in pattern_info.get("phrases", ())
+}
+
+# All phrases and keywords go into a single whole-word regex, so the text is
+# scanned once for red flags, positive indicators and keywords, and a
+# lowercased match (see _count_terms) is always one of the terms verbatim. It
+# is compiled twice: as is, for lowercased ASCII text, and with re.IGNORECASE,
+# for the original text of anything else. A term may be both a phrase and a
+# keyword (e.g. "study"). No term may contain or overlap another as a whole
+# word, or a match would hide it (checked by TestLexicon).
+_TERM_PATTERN = r"\b" + _trie_alternation({**_TERM_OWNERS, **dict.fromkeys(_KEYWORD_IMPACTS)}) + r"\b"
+_TERM_RE = re.compile(_TERM_PATTERN)
+_TERM_RE_IGNORECASE = re.compile(_TERM_PATTERN, re.IGNORECASE)
+
+# (list number, pattern index, check or substring) for the patterns that are
+# not phrases (e.g. capital letters); they overlap the terms, so they are run
+# on their own
+_PATTERN_CHECKS = tuple(
+    (list_number, index, pattern_info["check"])
+    for list_number, patterns in enumerate(_PATTERN_LISTS)
+    for index, pattern_info in enumerate(patterns)
+    if "check" in pattern_info
+)
+_PATTERN_SUBSTRINGS = tuple(
+    (list_number, index, pattern_info["substring"])
+    for list_number, patterns in enumerate(_PATTERN_LISTS)
+    for index, pattern_info in enumerate(patterns)
+    if "substring" in pattern_info
+)
+
+# Output fields as parallel tuples indexed like the pattern lists, so building
+# a result is plain tuple indexing rather than a dict lookup per field
+_POSITIVE_INDICATOR_DESCRIPTIONS = tuple(p["description"] for p in POSITIVE_INDICATORS_PATTERNS)
+_POSITIVE_INDICATOR_ICONS = tuple(p["icon"] for p in POSITIVE_INDICATORS_PATTERNS)
+_RED_FLAG_DESCRIPTIONS = tuple(p["description"] for p in RED_FLAG_PATTERNS)
+_RED_FLAG_SEVERITIES = tuple(p["severity"] for p in RED_FLAG_PATTERNS)
+
+
+# The non-ASCII characters re.IGNORECASE treats as equal to an ASCII letter
+# of the terms, mapped to that letter so every match lowercases to
+# its term. Non-ASCII text is not lowercased before matching phrases:
+# str.lower() can change its length (e.g. "İ" becomes "i" + U+0307) and so
+# create word boundaries the original text does not have.
+_TERM_CASE_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _count_terms(text: str) -> Counter:
+    """
+    Count the occurrences of each phrase and keyword in the text, by term.
+    
+    Only those terms are counted, never the other words of the text.
+    """
+    if text.isascii():
+        # Lowercasing ASCII text keeps every word boundary
+        return Counter(_TERM_RE.findall(text.lower()))
+    
+    term_counts = Counter()
+    for match, count in Counter(_TERM_RE_IGNORECASE.findall(text)).items():
+        term_counts[match.translate(_TERM_CASE_FOLDS).lower()] += count
+    return term_counts
+
+
+# Keywords, unlike phrases, are counted on the lowercased text
+_KEYWORD_RE = re.compile(r"\b" + _trie_alternation(_KEYWORD_IMPACTS) + r"\b")
+
+
+def _count_keywords(text: str, term_counts: Counter) -> Counter:
+    """
+    Count keyword occurrences, reusing term_counts (see _count_terms) when possible.
+    
+    ASCII text was lowercased for the term counts already, so they are
+    exact; other text is rescanned after lowercasing.
+    """
+    if text.isascii():
+        return term_counts
+    return Counter(_KEYWORD_RE.findall(text.lower()))
+
+
+def _match_patterns(text: str, term_counts: Counter) -> tuple:
+    """
+    Return the indices of the patterns found in the text, in pattern order,
+    as (red flag indices, positive indicator indices).
+    
+    Phrases come from term_counts (see _count_terms), everything else is
+    checked on the original text. Each pattern is reported at most once,
+    however often it matches.
+    """
+    matched = {_TERM_OWNERS[term] for term in term_counts if term in _TERM_OWNERS}
+    
+    for list_number, index, check in _PATTERN_CHECKS:
+        if check(text):
+            matched.add((list_number, index))
+    
+    for list_number, index, substring in _PATTERN_SUBSTRINGS:
+        if substring in text:
+            matched.add((list_number, index))
+    
+    indices = ([], [])
+    for list_number, index in sorted(matched):
+        indices[list_number].append(index)
+    return indices
+
+
+# Clients keep UI state per ID across results, so IDs must not repeat between
+# responses, workers or restarts. A counter from a random start per process
+# gives that without building a random UUID for every match.
+_id_counter = itertools.count(int.from_bytes(os.urandom(4), "big"))
 
 
 def _generate_id() -> str:
     """Generate a unique ID for analysis components."""
-    return str(uuid.uuid4())[:8]
+    return f"{next(_id_counter) & 0xFFFFFFFF:08x}"
+
+
+def _rank_keywords(term_counts: Counter) -> list:
+    """Build keyword entries for the keywords in term_counts, top 10 in keyword order."""
+    keywords = []
+    ranked = sorted(
+        (term for term in term_counts if term in _KEYWORD_RANKS),
+        key=_KEYWORD_RANKS.__getitem__,
+    )[:10]
+    for keyword in ranked:
+        weight = min(1.0, 0.3 + (term_counts[keyword] * 0.1))
+        keywords.append({
+            "term": keyword,
+            "impact": _KEYWORD_IMPACTS[keyword],
+            "weight": round(weight, 2)
+        })
+    
+    return keywords
+
+
+def _build_red_flags(indices: list) -> list:
+    """Build red flag entries for matched red flag pattern indices."""
+    return [
+        {
+            "id": f"rf-{_generate_id()}",
+            "description": _RED_FLAG_DESCRIPTIONS[index],
+            "severity": _RED_FLAG_SEVERITIES[index]
+        }
+        for index in indices
+    ]
+
 
+def _build_positive_indicators(indices: list) -> list:
+    """Build indicator entries for matched positive indicator pattern indices."""
+    return [
+        {
+            "id": f"pi-{_generate_id()}",
+            "description": _POSITIVE_INDICATOR_DESCRIPTIONS[index],
+            "icon": _POSITIVE_INDICATOR_ICONS[index]
+        }
+        for index in indices
+    ]
 
-def _find_red_flags(text: str) -> list:
+
+def _find_red_flags(text: str, *, stop_on_first_per_severity: bool = False) -> list:
     """
     Identify red flags in the text.
     
+    With stop_on_first_per_severity only the first red flag of each severity
+    is reported, for callers that only need to know which severities occur.
+    
     Returns list of red flags with id, description, and severity.
     Severity must be one of: "low", "medium", "high"
     """
-    red_flags = []
-    text_lower = text.lower()
+    red_flag_indices, _ = _match_patterns(text, _count_terms(text))
     
-    for pattern_info in RED_FLAG_PATTERNS:
-        if re.search(pattern_info["pattern"], text, re.IGNORECASE):
-            red_flags.append({
-                "id": f"rf-{_generate_id()}",
-                "description": pattern_info["description"],
-                "severity": pattern_info["severity"]
-            })
+    if stop_on_first_per_severity:
+        first_per_severity = {}
+        for index in red_flag_indices:
+            first_per_severity.setdefault(_RED_FLAG_SEVERITIES[index], index)
+        red_flag_indices = sorted(first_per_severity.values())
     
-    return red_flags
+    return _build_red_flags(red_flag_indices)
 
 
 def _find_positive_indicators(text: str) -> list:
@@ -159,17 +387,8 @@ def _find_positive_indicators(text: str) -> list:
     
     Returns list of indicators with id, description, and icon.
     """
-    indicators = []
-    
-    for pattern_info in POSITIVE_INDICATORS_PATTERNS:
-        if re.search(pattern_info["pattern"], text, re.IGNORECASE):
-            indicators.append({
-                "id": f"pi-{_generate_id()}",
-                "description": pattern_info["description"],
-                "icon": pattern_info["icon"]
-            })
-    
-    return indicators
+    _, indicator_indices = _match_patterns(text, _count_terms(text))
+    return _build_positive_indicators(indicator_indices)
 
 
 def _extract_keywords(text: str) -> list:
@@ -179,38 +398,7 @@ def _extract_keywords(text: str) -> list:
     Returns list of keywords with term, impact ("positive" or "negative"),
     and weight (0-1).
     """
-    keywords = []
-    text_lower = text.lower()
-    words = re.findall(r'\b[a-z]+\b', text_lower)
-    word_freq = {}
-    
-    for word in words:
-        if len(word) > 3:
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # Find positive keywords
-    for keyword in POSITIVE_KEYWORDS:
-        if keyword in word_freq:
-            freq = word_freq[keyword]
-            weight = min(1.0, 0.3 + (freq * 0.1))
-            keywords.append({
-                "term": keyword,
-                "impact": "positive",
-                "weight": round(weight, 2)
-            })
-    
-    # Find negative keywords
-    for keyword in NEGATIVE_KEYWORDS:
-        if keyword in word_freq:
-            freq = word_freq[keyword]
-            weight = min(1.0, 0.3 + (freq * 0.1))
-            keywords.append({
-                "term": keyword,
-                "impact": "negative",
-                "weight": round(weight, 2)
-            })
-    
-    return keywords[:10]  # Limit to top 10 keywords
+    return _rank_keywords(_count_keywords(text, _count_terms(text)))
 
 
 def _calculate_score(red_flags: list, positive_indicators: list, keywords: list) -> int:
@@ -241,33 +429,31 @@ def _calculate_score(red_flags: list, positive_indicators: list, keywords: list)
     return max(0, min(100, int(base_score)))
 
 
+# Assessment per 20-point score band: very low, low, mixed, moderate, high
+# (a perfect 100 falls in its own band and is also high)
+_OVERVIEW_ASSESSMENTS = (
+    "This content appears to have very low credibility.",
+    "This content shows low credibility.",
+    "This content has mixed credibility signals.",
+    "This content shows moderate credibility.",
+    "This content appears to be highly credible.",
+    "This content appears to be highly credible.",
+)
+
+
 def _generate_overview(score: int, red_flags: list, positive_indicators: list) -> str:
     """Generate a human-readable overview of the analysis."""
-    if score >= 80:
-        credibility = "high"
-        assessment = "This content appears to be highly credible."
-    elif score >= 60:
-        credibility = "moderate"
-        assessment = "This content shows moderate credibility."
-    elif score >= 40:
-        credibility = "mixed"
-        assessment = "This content has mixed credibility signals."
-    elif score >= 20:
-        credibility = "low"
-        assessment = "This content shows low credibility."
-    else:
-        credibility = "very low"
-        assessment = "This content appears to have very low credibility."
-    
-    details = []
+    assessment = _OVERVIEW_ASSESSMENTS[min(max(score, 0), 100) // 20]
+    
+    if positive_indicators and red_flags:
+        return (
+            f"{assessment} Found {len(positive_indicators)} positive indicator(s)"
+            f" and identified {len(red_flags)} red flag(s)."
+        )
     if positive_indicators:
-        details.append(f"Found {len(positive_indicators)} positive indicator(s)")
+        return f"{assessment} Found {len(positive_indicators)} positive indicator(s)."
     if red_flags:
-        details.append(f"identified {len(red_flags)} red flag(s)")
-    
-    if details:
-        detail_str = " and ".join(details)
-        return f"{assessment} {detail_str.capitalize()}."
+        return f"{assessment} Identified {len(red_flags)} red flag(s)."
     
     return assessment
 
@@ -279,23 +465,35 @@ def get_gpu_status() -> Dict[str, Any]:
     Returns:
         Dictionary containing GPU availability and device information.
     """
-    gpu_info = detect_gpu()
-    device = _get_cached_device()
-    
     return {
-        "gpu_available": gpu_info["available"],
-        "using_device": device,
-        "device_name": gpu_info["device_name"],
-        "cuda_version": gpu_info["cuda_version"],
+        "gpu_available": _GPU_INFO["available"],
+        "using_device": _get_cached_device(),
+        "device_name": _GPU_INFO["device_name"],
+        "cuda_version": _GPU_INFO["cuda_version"],
         "use_gpu_env": os.environ.get("USE_GPU", "false")
     }
 
 
+_NEUTRAL_SCORE = _calculate_score([], [], [])
+_MIN_ANALYZABLE_LENGTH = 2
+
+# The same text is often analyzed repeatedly (shared links, retries, page
+# reloads) and the analysis is deterministic, so results are memoized per
+# text. The key is a digest of the text rather than the text itself: fetched
+# pages can be megabytes long, and the cache must not keep them alive.
+# source_url is not part of the key: the analysis does not read it, and it
+# arrives from request JSON so it need not be hashable.
+ANALYSIS_CACHE_SIZE = 1024
+_analysis_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
 def analyze_content(text: str, source_url: Optional[str] = None) -> dict:
     """
     Perform credibility analysis on the provided text.
     
-    Uses GPU for inference when available and enabled, falls back to CPU gracefully.
+    The heuristics run in plain Python; GPU selection (see get_device) is
+    reserved for future ML model inference.
     
     Args:
         text: The content to analyze
@@ -309,14 +507,59 @@ def analyze_content(text: str, source_url: Optional[str] = None) -> dict:
         - positive_indicators: List of positive credibility signals
         - keywords: List of significant keywords with impact classification
     """
-    # Get the device for inference (GPU or CPU)
-    device = _get_cached_device()
-    
-    # Perform analysis (current implementation is heuristic-based,
-    # but device is available for future ML model inference)
-    red_flags = _find_red_flags(text)
-    positive_indicators = _find_positive_indicators(text)
-    keywords = _extract_keywords(text)
+    result = _analyze_cached(text)
+    
+    # Cached results are shared between calls, so hand out copies, with new
+    # IDs so that repeating an analysis does not repeat them
+    return {
+        "score": result["score"],
+        "overview": result["overview"],
+        "red_flags": [{**flag, "id": f"rf-{_generate_id()}"} for flag in result["red_flags"]],
+        "positive_indicators": [
+            {**indicator, "id": f"pi-{_generate_id()}"} for indicator in result["positive_indicators"]
+        ],
+        "keywords": [dict(keyword) for keyword in result["keywords"]]
+    }
+
+
+def _analyze_cached(text: str) -> dict:
+    """Return the analysis of the text; results are cached and must not be modified."""
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass")).digest()
+    with _analysis_cache_lock:
+        result = _analysis_cache.get(key)
+        if result is not None:
+            _analysis_cache.move_to_end(key)
+            return result
+    
+    # Analyze outside the lock so other threads are not held up
+    result = _analyze(text)
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return result
+
+
+def _analyze(text: str) -> dict:
+    """Run the analysis."""
+    # Nothing shorter than two characters can match any pattern or keyword,
+    # so skip straight to the neutral result the full pipeline would produce
+    if len(text.strip()) < _MIN_ANALYZABLE_LENGTH:
+        return {
+            "score": _NEUTRAL_SCORE,
+            "overview": _generate_overview(_NEUTRAL_SCORE, [], []),
+            "red_flags": [],
+            "positive_indicators": [],
+            "keywords": []
+        }
+    
+    # Scan the text once; red flags, positive indicators and keywords all
+    # come from the same term counts
+    term_counts = _count_terms(text)
+    red_flag_indices, indicator_indices = _match_patterns(text, term_counts)
+    red_flags = _build_red_flags(red_flag_indices)
+    positive_indicators = _build_positive_indicators(indicator_indices)
+    keywords = _rank_keywords(_count_keywords(text, term_counts))
     
     # Calculate score
     score = _calculate_score(red_flags, positive_indicators, keywords)
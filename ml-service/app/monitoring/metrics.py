@@ -6,6 +6,7 @@ and model metrics (inference_duration_seconds) for monitoring ML service perform
 
 Requirements: 2.1, 10.2
 """
+import os
 import time
 from contextlib import contextmanager
 from typing import Generator
@@ -17,6 +18,7 @@ from prometheus_client import (
     generate_latest,
     CONTENT_TYPE_LATEST,
     REGISTRY,
+    multiprocess,
 )
 
 
@@ -31,6 +33,14 @@ predictions_total = Counter(
     registry=metrics_registry,
 )
 
+# Label-bound children for the known label values, so recording a prediction
+# skips the per-call label lookup. These series are exported from startup.
+_PREDICTION_COUNTERS = {
+    (status, input_type): predictions_total.labels(status=status, input_type=input_type)
+    for status in ("success", "failure")
+    for input_type in ("text", "url")
+}
+
 prediction_confidence = Histogram(
     name="prediction_confidence",
     documentation="Distribution of prediction confidence scores (0-100)",
@@ -62,7 +72,10 @@ def record_prediction(
         status: Status of the prediction ("success" or "failure")
         input_type: Type of input ("text" or "url")
     """
-    predictions_total.labels(status=status, input_type=input_type).inc()
+    counter = _PREDICTION_COUNTERS.get((status, input_type))
+    if counter is None:
+        counter = predictions_total.labels(status=status, input_type=input_type)
+    counter.inc()
     
     if status == "success":
         prediction_confidence.observe(score)
@@ -99,9 +112,17 @@ def get_metrics() -> bytes:
     """
     Get all metrics in Prometheus exposition format.
 
+    When PROMETHEUS_MULTIPROC_DIR is set (multi-worker Gunicorn, see
+    gunicorn_conf.py) the values of all workers are aggregated.
+
     Returns:
         Bytes containing metrics in Prometheus format
     """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    
     return generate_latest(metrics_registry)
 
 
@@ -4,7 +4,8 @@ API routes for the ML Service.
 Includes health check, analysis, and Prometheus metrics endpoints.
 """
 import time
-from flask import Flask, request, jsonify, Response
+import orjson
+from flask import Flask, request, Response
 
 from .analyzer import analyze_content, get_gpu_status
 from .monitoring import (
@@ -14,6 +15,11 @@ from .monitoring import (
 )
 
 
+def _json_response(payload) -> Response:
+    """Serialize a payload to a JSON response with orjson."""
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
 def register_routes(app: Flask):
     """Register all routes with the Flask application."""
     
@@ -21,7 +27,7 @@ def register_routes(app: Flask):
     def health():
         """Health check endpoint with GPU status."""
         gpu_status = get_gpu_status()
-        return jsonify({
+        return _json_response({
             "status": "healthy",
             "service": "ml-service",
             "gpu": gpu_status
@@ -30,7 +36,7 @@ def register_routes(app: Flask):
     @app.route("/gpu-status", methods=["GET"])
     def gpu_status():
         """Get detailed GPU status information."""
-        return jsonify(get_gpu_status())
+        return _json_response(get_gpu_status())
     
     @app.route("/metrics", methods=["GET"])
     def metrics():
@@ -69,14 +75,14 @@ def register_routes(app: Flask):
         data = request.get_json()
         
         if not data:
-            return jsonify({
+            return _json_response({
                 "error": "INVALID_REQUEST",
                 "message": "Request body is required"
             }), 400
         
         text = data.get("text")
         if not text or not text.strip():
-            return jsonify({
+            return _json_response({
                 "error": "EMPTY_INPUT",
                 "message": "Text content is required"
             }), 400
@@ -98,7 +104,7 @@ def register_routes(app: Flask):
                 input_type=input_type,
             )
             
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             duration = time.perf_counter() - start_time
             
@@ -110,7 +116,7 @@ def register_routes(app: Flask):
                 input_type=input_type,
             )
             
-            return jsonify({
+            return _json_response({
                 "error": "ANALYSIS_FAILED",
                 "message": str(e)
             }), 500
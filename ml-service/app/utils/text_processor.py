@@ -5,6 +5,13 @@ import re
 from typing import List
 
 
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+# Sentence terminator followed by whitespace (the whitespace is split on)
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+
 def preprocess_text(text: str) -> str:
     """
     Preprocess text for analysis.
@@ -17,10 +24,10 @@ def preprocess_text(text: str) -> str:
     text = text.replace('\r\n', '\n').replace('\r', '\n')
     
     # Replace multiple spaces with single space
-    text = re.sub(r' +', ' ', text)
+    text = _MULTI_SPACE_RE.sub(' ', text)
     
     # Replace multiple newlines with double newline
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MULTI_NEWLINE_RE.sub('\n\n', text)
     
     return text.strip()
 
@@ -32,5 +39,5 @@ def extract_sentences(text: str) -> List[str]:
     Returns a list of sentences.
     """
     # Simple sentence splitting on common terminators
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    return [s.strip() for s in sentences if s.strip()]
+    sentences = _SENTENCE_BOUNDARY_RE.split(text)
+    return [s for s in map(str.strip, sentences) if s]
@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for the ML Service.
+
+Analysis is CPU-bound and holds the GIL, so throughput comes from running
+several worker processes; each worker also runs a few threads so slow
+clients and health checks don't block analysis requests.
+
+Usage:
+    gunicorn --config gunicorn_conf.py app.main:app
+"""
+import multiprocessing
+import os
+import shutil
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+
+# Each worker keeps its own metric values; prometheus_client aggregates them
+# from this directory. It must be set before the workers import the app.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server):
+    """Start from an empty metrics directory so stale values are not reported."""
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop the metric files of a worker that has exited."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,12 @@
+"""
+Shared pytest fixtures for the ML Service tests.
+"""
+import pytest
+
+import app.analyzer as analyzer_module
+
+
+@pytest.fixture
+def reset_device(monkeypatch):
+    """Clear the cached device selection for the duration of a test."""
+    monkeypatch.setattr(analyzer_module, "_DEVICE", None)
@@ -6,102 +6,105 @@ Tests cover:
 - Red flag severity values ("low", "medium", "high") - Requirements 3.2
 - Keyword weight range (0-1) - Requirements 3.4
 """
+import re
+import tracemalloc
+import uuid
+
 import pytest
 from app.analyzer import (
     analyze_content,
     _find_red_flags,
     _find_positive_indicators,
     _extract_keywords,
-    _calculate_score
+    _calculate_score,
+    _count_terms,
+    _TERM_OWNERS,
+    _KEYWORD_IMPACTS,
+)
+
+_VALID_SEVERITIES = frozenset({"low", "medium", "high"})
+
+# Highly positive content
+_POSITIVE_CONTENT = (
+    "According to a peer-reviewed study published in a scientific journal, "
+    "Dr. Smith, a professor at the university, confirmed the research data "
+    "shows evidence based on expert analysis and verified statistics."
+)
+
+# Highly negative content
+_NEGATIVE_CONTENT = (
+    "SHOCKING!!! You won't believe this miracle cure!! "
+    "They don't want you to know the hidden truth! "
+    "This is 100% proven and absolutely certain! "
+    "CLICK HERE NOW! ACT FAST! SHARE NOW!"
+)
+
+# Content with many positive signals
+_ALL_POSITIVE_SIGNALS = (
+    "Research study evidence analysis data report expert scientist "
+    "professor peer-reviewed journal verified confirmed documented "
+    "official factual according to cited source university institution "
+    "organization published statistics percent"
+)
+
+# Content with many negative signals
+_ALL_RED_FLAGS = (
+    "SHOCKING UNBELIEVABLE SECRET CONSPIRACY HOAX MIRACLE GUARANTEED "
+    "EXCLUSIVE URGENT BREAKING VIRAL EXPOSED BANNED CENSORED SUPPRESSED "
+    "You won't believe this!!! They don't want you to know!!! "
+    "CLICK HERE NOW!!! ACT FAST!!! 100% PROVEN!!!"
 )
 
 
 class TestScoreRange:
     """Tests for score range validation - Requirements 3.2, 3.4"""
     
-    def test_score_is_integer(self):
-        """Score should be an integer."""
-        result = analyze_content("This is a test article about research.")
+    @pytest.mark.parametrize("text", [
+        "This is a test article about research.",
+        "This is a simple test article.",
+        _POSITIVE_CONTENT,
+        _NEGATIVE_CONTENT,
+        # Must not exceed 100
+        _ALL_POSITIVE_SIGNALS,
+        # Must not go below 0
+        _ALL_RED_FLAGS,
+    ], ids=["research", "neutral", "positive", "negative", "all_positive_signals", "all_red_flags"])
+    def test_score_is_integer_in_valid_range(self, text):
+        """Score should be an integer between 0 and 100 for any content."""
+        result = analyze_content(text)
         assert isinstance(result["score"], int)
-    
-    def test_score_in_valid_range_neutral_content(self):
-        """Score should be between 0 and 100 for neutral content."""
-        result = analyze_content("This is a simple test article.")
         assert 0 <= result["score"] <= 100
-    
-    def test_score_in_valid_range_positive_content(self):
-        """Score should be between 0 and 100 for highly positive content."""
-        result = analyze_content(
-            "According to a peer-reviewed study published in a scientific journal, "
-            "Dr. Smith, a professor at the university, confirmed the research data "
-            "shows evidence based on expert analysis and verified statistics."
-        )
-        assert 0 <= result["score"] <= 100
-    
-    def test_score_in_valid_range_negative_content(self):
-        """Score should be between 0 and 100 for highly negative content."""
-        result = analyze_content(
-            "SHOCKING!!! You won't believe this miracle cure!! "
-            "They don't want you to know the hidden truth! "
-            "This is 100% proven and absolutely certain! "
-            "CLICK HERE NOW! ACT FAST! SHARE NOW!"
-        )
-        assert 0 <= result["score"] <= 100
-    
-    def test_score_does_not_exceed_100(self):
-        """Score should never exceed 100 even with many positive indicators."""
-        # Content with many positive signals
-        result = analyze_content(
-            "Research study evidence analysis data report expert scientist "
-            "professor peer-reviewed journal verified confirmed documented "
-            "official factual according to cited source university institution "
-            "organization published statistics percent"
-        )
-        assert result["score"] <= 100
-    
-    def test_score_does_not_go_below_0(self):
-        """Score should never go below 0 even with many red flags."""
-        # Content with many negative signals
-        result = analyze_content(
-            "SHOCKING UNBELIEVABLE SECRET CONSPIRACY HOAX MIRACLE GUARANTEED "
-            "EXCLUSIVE URGENT BREAKING VIRAL EXPOSED BANNED CENSORED SUPPRESSED "
-            "You won't believe this!!! They don't want you to know!!! "
-            "CLICK HERE NOW!!! ACT FAST!!! 100% PROVEN!!!"
-        )
-        assert result["score"] >= 0
 
 
 class TestRedFlagSeverity:
     """Tests for red flag severity values - Requirements 3.2"""
     
-    VALID_SEVERITIES = ["low", "medium", "high"]
-    
     def test_red_flags_have_valid_severity(self):
         """All red flags should have severity as 'low', 'medium', or 'high'."""
         result = analyze_content("SHOCKING NEWS! You won't believe this miracle cure!")
         assert len(result["red_flags"]) > 0, "Expected at least one red flag"
         for flag in result["red_flags"]:
-            assert flag["severity"] in self.VALID_SEVERITIES, \
+            assert flag["severity"] in _VALID_SEVERITIES, \
                 f"Invalid severity: {flag['severity']}"
     
     def test_low_severity_red_flags(self):
         """Should detect low severity red flags."""
         # Excessive caps and exclamation marks are low severity
-        flags = _find_red_flags("CLICK HERE NOW!!! Share this!!!")
+        flags = _find_red_flags("CLICK HERE NOW!!! Share this!!!", stop_on_first_per_severity=True)
         severities = [f["severity"] for f in flags]
         assert "low" in severities
     
     def test_medium_severity_red_flags(self):
         """Should detect medium severity red flags."""
         # Sensationalist language is medium severity
-        flags = _find_red_flags("You won't believe this shocking news!")
+        flags = _find_red_flags("You won't believe this shocking news!", stop_on_first_per_severity=True)
         severities = [f["severity"] for f in flags]
         assert "medium" in severities
     
     def test_high_severity_red_flags(self):
         """Should detect high severity red flags."""
         # Conspiracy language and miracle claims are high severity
-        flags = _find_red_flags("They don't want you to know this miracle cure!")
+        flags = _find_red_flags("They don't want you to know this miracle cure!", stop_on_first_per_severity=True)
         severities = [f["severity"] for f in flags]
         assert "high" in severities
     
@@ -116,6 +119,16 @@ class TestRedFlagSeverity:
             assert isinstance(flag["id"], str)
             assert isinstance(flag["description"], str)
             assert isinstance(flag["severity"], str)
+    
+    def test_stop_on_first_per_severity_reports_each_severity_once(self):
+        """Only the first red flag of each severity should be reported."""
+        text = "SHOCKING!!! This secret miracle is fake news, CLICK HERE"
+        all_flags = _find_red_flags(text)
+        first_flags = _find_red_flags(text, stop_on_first_per_severity=True)
+        severities = [f["severity"] for f in first_flags]
+        assert len(severities) == len(set(severities))
+        assert set(severities) == {f["severity"] for f in all_flags}
+        assert len(first_flags) < len(all_flags)
 
 
 class TestKeywordWeightRange:
@@ -151,6 +164,11 @@ class TestKeywordWeightRange:
         for kw in negative_keywords:
             assert 0 <= kw["weight"] <= 1
     
+    def test_hyphenated_keyword_detection(self):
+        """Hyphenated keywords such as 'peer-reviewed' should be detected."""
+        keywords = _extract_keywords("The findings were peer-reviewed by two panels.")
+        assert "peer-reviewed" in [k["term"] for k in keywords]
+    
     def test_keyword_structure(self):
         """Keywords should have term, impact, and weight fields."""
         keywords = _extract_keywords("Research shows shocking evidence")
@@ -183,43 +201,77 @@ class TestKeywordWeightRange:
         assert multiple_weight <= 1.0
 
 
+@pytest.fixture(scope="class")
+def content_result():
+    """Analysis of a plain text, shared by the structure tests."""
+    return analyze_content("Test content")
+
+
 class TestAnalyzeContent:
     """Tests for the main analyze_content function."""
     
-    def test_returns_required_fields(self):
+    def test_returns_required_fields(self, content_result):
         """Result should contain all required fields."""
-        result = analyze_content("Test content")
-        assert "score" in result
-        assert "overview" in result
-        assert "red_flags" in result
-        assert "positive_indicators" in result
-        assert "keywords" in result
+        assert "score" in content_result
+        assert "overview" in content_result
+        assert "red_flags" in content_result
+        assert "positive_indicators" in content_result
+        assert "keywords" in content_result
     
-    def test_overview_is_string(self):
+    def test_overview_is_string(self, content_result):
         """Overview should be a non-empty string."""
-        result = analyze_content("Test content")
-        assert isinstance(result["overview"], str)
-        assert len(result["overview"]) > 0
-    
-    def test_red_flags_is_list(self):
-        """Red flags should be a list."""
-        result = analyze_content("Test content")
-        assert isinstance(result["red_flags"], list)
-    
-    def test_positive_indicators_is_list(self):
-        """Positive indicators should be a list."""
-        result = analyze_content("Test content")
-        assert isinstance(result["positive_indicators"], list)
-    
-    def test_keywords_is_list(self):
-        """Keywords should be a list."""
-        result = analyze_content("Test content")
-        assert isinstance(result["keywords"], list)
+        assert isinstance(content_result["overview"], str)
+        assert len(content_result["overview"]) > 0
+    
+    @pytest.mark.parametrize("field", ["red_flags", "positive_indicators", "keywords"])
+    def test_list_fields_are_lists(self, content_result, field):
+        """Red flags, positive indicators and keywords should be lists."""
+        assert isinstance(content_result[field], list)
+    
+    @pytest.mark.parametrize("text", ["", "   ", "\n\t", "a", " ! "])
+    def test_blank_or_tiny_content_is_neutral(self, text):
+        """Blank or single-character content should get the neutral result."""
+        result = analyze_content(text)
+        assert result["score"] == 50
+        assert result["red_flags"] == []
+        assert result["positive_indicators"] == []
+        assert result["keywords"] == []
+        assert isinstance(result["overview"], str) and result["overview"]
     
     def test_source_url_parameter_accepted(self):
         """Should accept optional source_url parameter."""
         result = analyze_content("Test content", source_url="https://example.com")
         assert "score" in result
+    
+    @pytest.mark.parametrize("source_url", [{"u": 1}, ["https://example.com"]])
+    def test_unhashable_source_url_accepted(self, source_url):
+        """A source_url of any JSON type should not break the analysis."""
+        result = analyze_content("Hello research", source_url=source_url)
+        expected = analyze_content("Hello research")
+        assert result["score"] == expected["score"]
+        assert result["overview"] == expected["overview"]
+    
+    def test_long_text_not_retained_by_cache(self):
+        """Caching a result should not keep the analyzed text alive."""
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            analyze_content(f"{uuid.uuid4()} " + "research " * 100_000)
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert after - before < 100_000
+    
+    def test_repeated_analysis_returns_independent_results(self):
+        """Modifying a result should not affect later results for the same text."""
+        text = "SHOCKING!!! A study of the data"
+        first = analyze_content(text)
+        first["red_flags"][0]["severity"] = "modified"
+        first["keywords"].clear()
+        
+        second = analyze_content(text)
+        assert second["red_flags"][0]["severity"] != "modified"
+        assert len(second["keywords"]) > 0
 
 
 class TestRedFlags:
@@ -237,6 +289,71 @@ class TestRedFlags:
         descriptions = [f["description"] for f in flags]
         assert any("conspiracy" in d.lower() for d in descriptions)
     
+    def test_repeated_red_flag_reported_once(self):
+        """A pattern matching several times should yield a single red flag."""
+        flags = _find_red_flags("Shocking news, truly shocking. You won't believe it!")
+        descriptions = [f["description"] for f in flags]
+        assert descriptions.count("Uses sensationalist language") == 1
+    
+    def test_overlapping_red_flags_all_detected(self):
+        """Text matching several patterns at once should raise each red flag."""
+        flags = _find_red_flags("SHOCKING")
+        descriptions = [f["description"] for f in flags]
+        assert "Uses sensationalist language" in descriptions
+        assert "Excessive use of capital letters" in descriptions
+    
+    def test_ids_unique_within_result(self):
+        """Red flag and positive indicator IDs should be unique within a result."""
+        result = analyze_content(
+            "SHOCKING!!! A secret miracle cure, according to a study by Dr. Smith."
+        )
+        ids = [item["id"] for item in result["red_flags"] + result["positive_indicators"]]
+        assert len(ids) > 1
+        assert len(ids) == len(set(ids))
+    
+    def test_ids_differ_between_repeated_results(self):
+        """Analyzing the same text again should not reuse any IDs."""
+        text = "SHOCKING!!! A secret miracle cure, according to a study by Dr. Smith."
+        first, second = analyze_content(text), analyze_content(text)
+        first_ids = {item["id"] for item in first["red_flags"] + first["positive_indicators"]}
+        second_ids = {item["id"] for item in second["red_flags"] + second["positive_indicators"]}
+        assert first_ids
+        assert first_ids.isdisjoint(second_ids)
+    
+    def test_phrases_match_whole_words_only(self):
+        """Phrases embedded in longer words should not raise red flags."""
+        flags = _find_red_flags("The secretary said the miracles were unbelievably dull.")
+        descriptions = [f["description"] for f in flags]
+        assert "Conspiracy-style language" not in descriptions
+        assert "Makes unrealistic claims" not in descriptions
+        assert "Uses sensationalist language" not in descriptions
+    
+    def test_phrase_variants_detected(self):
+        """Hyphenated and spaced variants of a phrase should both be detected."""
+        for text in ("A cure-all remedy", "A cure all remedy", "A Cure-All remedy"):
+            descriptions = [f["description"] for f in _find_red_flags(text)]
+            assert "Makes unrealistic claims" in descriptions, text
+    
+    def test_capital_letters_check_is_case_sensitive(self):
+        """Only runs of upper-case letters should count as excessive capitals."""
+        lower_flags = _find_red_flags("Ordinary sentences contain longer words.")
+        upper_flags = _find_red_flags("ORDINARY sentences contain longer words.")
+        assert "Excessive use of capital letters" not in [f["description"] for f in lower_flags]
+        assert "Excessive use of capital letters" in [f["description"] for f in upper_flags]
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("ABCDE", True),
+        ("ABCD", False),
+        ("ABCÉDE", False),
+        ("ÉTUDE", False),
+        ("ok \ud800 SHOUT", True),
+    ])
+    def test_capital_letters_run_of_five_ascii_capitals(self, text, expected):
+        """Five consecutive ASCII capitals are needed; other characters break the run."""
+        flags = _find_red_flags(text)
+        found = "Excessive use of capital letters" in [f["description"] for f in flags]
+        assert found is expected
+    
     def test_no_red_flags_for_clean_content(self):
         """Should return empty list for content without red flags."""
         flags = _find_red_flags("This is a simple factual statement.")
@@ -267,6 +384,48 @@ class TestPositiveIndicators:
             assert "id" in indicator, "Indicator missing 'id' field"
             assert "description" in indicator, "Indicator missing 'description' field"
             assert "icon" in indicator, "Indicator missing 'icon' field"
+    
+    @pytest.mark.parametrize("text, description", [
+        ("İsource", "Cites sources"),
+        ("İSTUDIES", "References scientific research"),
+        ("İyou won't believe", "Uses sensationalist language"),
+    ])
+    def test_lowercasing_does_not_split_words(self, text, description):
+        """A phrase glued to a dotted capital I is not a whole word."""
+        result = analyze_content(text)
+        found = [f["description"] for f in result["red_flags"] + result["positive_indicators"]]
+        assert description not in found
+    
+    def test_non_ascii_case_variants_still_match(self):
+        """Phrases should match case-insensitively in non-ASCII text too."""
+        indicators = _find_positive_indicators("Ünïcödé RESEARCH by a Professor")
+        descriptions = [i["description"] for i in indicators]
+        assert "References scientific research" in descriptions
+        assert "References expert opinions" in descriptions
+
+
+class TestLexicon:
+    """Tests for the combined phrase and keyword lexicon."""
+    
+    def test_terms_never_overlap_as_whole_words(self):
+        """
+        One scan finds every term only if no term contains or overlaps another
+        at word boundaries (e.g. a phrase "breaking news" would hide the
+        keyword "breaking"). Check each term, and each pair of terms sharing
+        an overlap, against a separate search for every term.
+        """
+        terms = set(_TERM_OWNERS) | set(_KEYWORD_IMPACTS)
+        searches = {term: re.compile(r"\b" + re.escape(term) + r"\b") for term in terms}
+        texts = set(terms)
+        for first in terms:
+            for second in terms:
+                for size in range(1, min(len(first), len(second))):
+                    if first[-size:] == second[:size]:
+                        texts.add(first + second[size:])
+        
+        for text in texts:
+            expected = {term for term, search in searches.items() if search.search(text)}
+            assert set(_count_terms(text)) == expected, text
 
 
 class TestCalculateScore:
@@ -10,7 +10,7 @@ Tests verify that:
 - Fallback to CPU works gracefully when GPU unavailable
 """
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import pytest
 from hypothesis import given, strategies as st, settings
 
@@ -21,13 +21,49 @@ from app.analyzer import (
     analyze_content,
 )
 
+# Fixed inputs for the structural analysis checks, covering the shapes that
+# matter to the analyzer: plain prose, each kind of pattern, repetition,
+# punctuation, whitespace and non-ASCII text
+_FUZZ_CORPUS = [
+    "Test content",
+    "a" * 10,
+    "x" * 500,
+    "          ",
+    "\n\t\n\t\n\t\n\t\n\t",
+    "!!!!!!!!!!",
+    "SHOCKING!!! You won't believe this!",
+    "research study evidence",
+    "According to a peer-reviewed study, Dr. Smith found 40% more cases.",
+    "They don't want you to know this miracle cure-all is guaranteed",
+    "CLICK HERE NOW and share now, act fast!!",
+    "shocking " * 50,
+    "The university published data and statistics in a journal.",
+    "1234567890 %%% ### @@@ ???",
+    "studying researchers misquoted the sources",
+    "\u200b\u200b\u200b\u200b\u200b\u200b\u200b\u200b\u200b\u200b",
+    "Ünïcödé téxt wîth àccents, ÉTUDE SCIENTIFIQUE",
+    "İSTANBUL ıstanbul ǅemal ß ﬁnance",
+    "研究表明这是一个秘密 — 専門家 😀😀😀",
+    "Mixed\r\nline\rendings\nwith SECRET\u00a0data",
+]
+
+
+class _FakeTorchNoCuda:
+    """Minimal stand-in for a CPU-only torch module."""
+    
+    class cuda:
+        @staticmethod
+        def is_available():
+            return False
+    
+    class version:
+        cuda = None
+
 
 class TestGPUDetection:
     """Property tests for GPU detection - Property 10: GPU Detection and Usage"""
     
-    @settings(max_examples=100)
-    @given(st.text(min_size=1, max_size=500))
-    def test_detect_gpu_returns_valid_structure(self, _text: str):
+    def test_detect_gpu_returns_valid_structure(self):
         """
         Property 10: GPU Detection and Usage
         For any call to detect_gpu, the result SHALL contain all required fields
@@ -57,10 +93,6 @@ class TestGPUDetection:
         'cpu' when USE_GPU is disabled, regardless of GPU availability.
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         with patch.dict(os.environ, {"USE_GPU": use_gpu_value}):
             device = get_device()
             
@@ -71,18 +103,12 @@ class TestGPUDetection:
             if use_gpu_value.lower() in ("false", "0", "no"):
                 assert device == "cpu"
     
-    @settings(max_examples=100)
-    @given(st.text(min_size=1, max_size=200))
-    def test_get_gpu_status_returns_complete_info(self, _text: str):
+    def test_get_gpu_status_returns_complete_info(self):
         """
         Property 10: GPU Detection and Usage
         For any call to get_gpu_status, the result SHALL contain all monitoring fields.
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         status = get_gpu_status()
         
         # Must have all required fields
@@ -96,8 +122,7 @@ class TestGPUDetection:
         assert isinstance(status["gpu_available"], bool)
         assert status["using_device"] in ("cuda", "cpu")
     
-    @settings(max_examples=100)
-    @given(st.text(min_size=10, max_size=500))
+    @pytest.mark.parametrize("text", _FUZZ_CORPUS)
     def test_analyze_content_works_regardless_of_gpu(self, text: str):
         """
         Property 10: GPU Detection and Usage
@@ -105,10 +130,6 @@ class TestGPUDetection:
         regardless of GPU availability (graceful fallback).
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         # Should not raise any exceptions
         result = analyze_content(text)
         
@@ -126,70 +147,43 @@ class TestGPUDetection:
 class TestGPUFallback:
     """Tests for GPU fallback behavior - Property 10"""
     
-    def test_fallback_when_torch_not_available(self):
+    def test_fallback_when_torch_not_available(self, monkeypatch):
         """
         Property 10: GPU Detection and Usage
         When PyTorch is not available, detect_gpu SHALL return CPU device
         without raising an error.
         **Validates: Requirements 2.2**
         """
-        with patch.dict('sys.modules', {'torch': None}):
-            # Force reimport to trigger ImportError path
-            import importlib
-            import app.analyzer as analyzer_module
-            
-            # Mock the import to raise ImportError
-            original_detect = analyzer_module.detect_gpu
-            
-            def mock_detect():
-                try:
-                    raise ImportError("No module named 'torch'")
-                except ImportError:
-                    return {
-                        "available": False,
-                        "device": "cpu",
-                        "device_name": None,
-                        "cuda_version": None
-                    }
-            
-            with patch.object(analyzer_module, 'detect_gpu', mock_detect):
-                result = analyzer_module.detect_gpu()
-                assert result["available"] is False
-                assert result["device"] == "cpu"
+        import app.analyzer as analyzer_module
+        monkeypatch.setattr(analyzer_module, "_TORCH", None)
+        
+        result = detect_gpu()
+        assert result["available"] is False
+        assert result["device"] == "cpu"
     
-    def test_fallback_when_cuda_not_available(self):
+    def test_fallback_when_cuda_not_available(self, monkeypatch):
         """
         Property 10: GPU Detection and Usage
         When CUDA is not available, detect_gpu SHALL return CPU device.
         **Validates: Requirements 2.2**
         """
-        mock_torch = MagicMock()
-        mock_torch.cuda.is_available.return_value = False
+        import app.analyzer as analyzer_module
+        monkeypatch.setattr(analyzer_module, "_TORCH", _FakeTorchNoCuda)
         
-        with patch.dict('sys.modules', {'torch': mock_torch}):
-            result = detect_gpu()
-            # Should fall back to CPU
-            assert result["device"] == "cpu"
+        result = detect_gpu()
+        # Should fall back to CPU
+        assert result["device"] == "cpu"
     
-    @settings(max_examples=100)
-    @given(st.text(min_size=10, max_size=200))
-    def test_analysis_succeeds_with_cpu_fallback(self, text: str):
+    def test_status_reports_cpu_when_gpu_disabled(self, reset_device):
         """
         Property 10: GPU Detection and Usage
-        For any text, analysis SHALL succeed when falling back to CPU.
+        When USE_GPU disables the GPU, the GPU status SHALL report the CPU
+        as the device in use.
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         # Force CPU mode
         with patch.dict(os.environ, {"USE_GPU": "false"}):
-            result = analyze_content(text)
-            
-            # Analysis must complete successfully
-            assert isinstance(result["score"], int)
-            assert 0 <= result["score"] <= 100
+            assert get_gpu_status()["using_device"] == "cpu"
 
 
 class TestGPUEnvironmentVariables:
@@ -204,25 +198,17 @@ class TestGPUEnvironmentVariables:
         GPU availability rather than defaulting to a specific device.
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         with patch.dict(os.environ, {"USE_GPU": value}):
             device = get_device()
             # Must return a valid device
             assert device in ("cuda", "cpu")
     
-    def test_use_gpu_env_included_in_status(self):
+    def test_use_gpu_env_included_in_status(self, reset_device):
         """
         Property 10: GPU Detection and Usage
         The USE_GPU environment variable value SHALL be included in GPU status.
         **Validates: Requirements 2.2**
         """
-        # Reset cached device
-        import app.analyzer as analyzer_module
-        analyzer_module._DEVICE = None
-        
         test_value = "test_value"
         with patch.dict(os.environ, {"USE_GPU": test_value}):
             status = get_gpu_status()